@@ -0,0 +1,59 @@
+"""create employees table
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-14 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Databases bootstrapped by the old startup-time create_all() already have
+    # the table (and possibly some indexes); only add what is missing. Offline
+    # (--sql) runs cannot inspect, so they emit the full schema.
+    inspector = None if context.is_offline_mode() else sa.inspect(op.get_bind())
+    if inspector is None or not inspector.has_table("employees"):
+        op.create_table(
+            "employees",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("name", sa.String(), nullable=False),
+            sa.Column("title", sa.String(), nullable=False),
+            sa.Column("job_history", sa.String(), nullable=True),
+            sa.Column("salary", sa.Numeric(precision=12, scale=2), nullable=False),
+            sa.Column("years_of_experience", sa.Integer(), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        existing = set()
+    else:
+        existing = {ix["name"] for ix in inspector.get_indexes("employees")}
+
+    if "ix_employees_id" not in existing:
+        op.create_index("ix_employees_id", "employees", ["id"])
+    if "ix_employees_title_salary" not in existing:
+        op.create_index(
+            "ix_employees_title_salary", "employees", ["title", sa.text("salary DESC")]
+        )
+    if "ix_employees_yoe_name" not in existing:
+        op.create_index(
+            "ix_employees_yoe_name", "employees", [sa.text("years_of_experience DESC"), "name"]
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_employees_yoe_name", table_name="employees")
+    op.drop_index("ix_employees_title_salary", table_name="employees")
+    op.drop_index("ix_employees_id", table_name="employees")
+    op.drop_table("employees")
@@ -1,13 +1,61 @@
-from typing import List, Optional, Dict
+from typing import AsyncIterator, List, Optional, Dict, Sequence
 
-from fastapi import APIRouter, HTTPException, Query
+import orjson
+from cachetools import TTLCache
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field, ConfigDict
+from sqlalchemy import RowMapping
 
 from src.employees_manager import EmployeesManager
 
 
 router = APIRouter(prefix="/employees", tags=["Employees"])
-manager = EmployeesManager()
+
+
+def get_employees_manager(request: Request) -> EmployeesManager:
+    """Return the per-process manager created in the app lifespan."""
+    return request.app.state.employees_manager
+
+
+# Process-local cache of serialized list responses. Writes bump the generation
+# that is part of every key, so entries from before a write are never served
+# again by this process; other workers may serve them until the TTL expires.
+# The cache is bounded by total body size, and oversized bodies are not cached,
+# so client-chosen `top` / `fields` combinations cannot grow it without limit.
+_LIST_CACHE_MAX_BYTES = 16 * 1024 * 1024
+_LIST_CACHE_MAX_ENTRY_BYTES = 256 * 1024
+_list_cache: TTLCache = TTLCache(maxsize=_LIST_CACHE_MAX_BYTES, ttl=5, getsizeof=len)
+_list_cache_generation = 0
+
+
+def _invalidate_list_cache() -> None:
+    global _list_cache_generation
+    _list_cache_generation += 1
+
+
+# Upper bound on rows accepted by a single bulk-create request
+_BULK_MAX_ROWS = 1000
+
+# Requests for more rows than this are streamed from a server-side cursor (and
+# not cached) instead of being loaded and serialized into one response body
+_STREAM_THRESHOLD = 1000
+_STREAM_CHUNK_ROWS = 500
+
+
+async def _stream_json_array(
+    chunks: AsyncIterator[Sequence[RowMapping]],
+) -> AsyncIterator[bytes]:
+    """Yield row **chunks** as one JSON array, serializing a chunk at a time."""
+    yield b"["
+    first = True
+    async for chunk in chunks:
+        if not chunk:
+            continue
+        body = b",".join(orjson.dumps(dict(r)) for r in chunk)
+        yield body if first else b"," + body
+        first = False
+    yield b"]"
 
 
 # --- Pydantic Schemas ---
@@ -27,7 +75,7 @@ class EmployeeUpdate(BaseModel):
     years_of_experience: Optional[int] = Field(None, ge=0)
 
     def dict_updates(self) -> Dict:
-        return {k: v for k, v in self.model_dump().items() if v is not None}
+        return self.model_dump(exclude_none=True)
 
 
 class EmployeeOut(BaseModel):
@@ -46,23 +94,67 @@ class EmployeeOut(BaseModel):
     "/healthcheck",
     summary="Healthcheck endpoint",
 )
-def healthcheck():
+async def healthcheck():
     return {"status": "ok"}
 
 
 @router.get(
     "",
-    response_model=List[EmployeeOut],
+    response_class=ORJSONResponse,
+    responses={
+        200: {
+            "model": List[EmployeeOut],
+            "description": "Matching employees. When `fields` is given, each row "
+            "contains only those keys.",
+        }
+    },
     summary="List / search employees",
 )
-def list_employees(
+async def list_employees(
     top: int = Query(10, gt=0),
     order_by: List[str] = Query(["-salary"]),
     title: Optional[str] = Query(None),
+    fields: Optional[List[str]] = Query(
+        None,
+        description="Fields to return (default: all). Keys not listed are omitted "
+        "from every row, so rows are partial `EmployeeOut` objects.",
+    ),
+    manager: EmployeesManager = Depends(get_employees_manager),
 ):
     filters = {"title": title} if title else {}
-    emps = manager.get_top_employees(n=top, order_by=order_by, filters=filters)
-    return emps
+    # rows come straight from the DB, so skip response_model validation
+    if top > _STREAM_THRESHOLD:
+        try:
+            chunks = manager.stream_top_employees(
+                n=top, order_by=order_by, filters=filters, fields=fields,
+                chunk_size=_STREAM_CHUNK_ROWS,
+            )
+        except ValueError as exc:
+            raise HTTPException(400, str(exc))
+        return StreamingResponse(_stream_json_array(chunks), media_type="application/json")
+
+    key = (
+        _list_cache_generation,
+        top,
+        tuple(order_by),
+        title,
+        tuple(fields) if fields else None,
+    )
+    cached = _list_cache.get(key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    try:
+        rows = await manager.get_top_employees(
+            n=top, order_by=order_by, filters=filters, fields=fields
+        )
+    except ValueError as exc:
+        raise HTTPException(400, str(exc))
+
+    response = ORJSONResponse([dict(r) for r in rows])
+    if len(response.body) <= _LIST_CACHE_MAX_ENTRY_BYTES:
+        _list_cache[key] = response.body
+    return response
 
 
 @router.post(
@@ -71,25 +163,50 @@ def list_employees(
     status_code=201,
     summary="Create a new employee",
 )
-def create_employee(payload: EmployeeCreate):
-    emp = manager.create_employee(**payload.model_dump())
+async def create_employee(
+    payload: EmployeeCreate,
+    manager: EmployeesManager = Depends(get_employees_manager),
+):
+    emp = await manager.create_employee(**payload.model_dump())
+    _invalidate_list_cache()
     return emp
 
 
+@router.post(
+    "/bulk",
+    response_class=ORJSONResponse,
+    status_code=201,
+    responses={201: {"model": List[EmployeeOut]}},
+    summary="Create many employees at once",
+)
+async def bulk_create_employees(
+    payload: List[EmployeeCreate] = Body(..., max_length=_BULK_MAX_ROWS),
+    manager: EmployeesManager = Depends(get_employees_manager),
+):
+    rows = await manager.bulk_create_employees([p.model_dump() for p in payload])
+    _invalidate_list_cache()
+    return ORJSONResponse([dict(r) for r in rows], status_code=201)
+
+
 @router.put(
     "/{emp_id}",
     response_model=EmployeeOut,
     summary="Update an existing employee",
 )
-def update_employee(emp_id: int, payload: EmployeeUpdate):
+async def update_employee(
+    emp_id: int,
+    payload: EmployeeUpdate,
+    manager: EmployeesManager = Depends(get_employees_manager),
+):
     updates = payload.dict_updates()
     if not updates:
         raise HTTPException(400, "No fields provided to update")
 
     try:
-        emp = manager.update_employee(emp_id, **updates)
+        emp = await manager.update_employee(emp_id, **updates)
     except ValueError as exc:
         raise HTTPException(404, str(exc))
+    _invalidate_list_cache()
     return emp
 
 
@@ -98,8 +215,12 @@ def update_employee(emp_id: int, payload: EmployeeUpdate):
     status_code=204,
     summary="Delete an employee",
 )
-def delete_employee(emp_id: int):
+async def delete_employee(
+    emp_id: int,
+    manager: EmployeesManager = Depends(get_employees_manager),
+):
     try:
-        manager.delete_employee(emp_id)
+        await manager.delete_employee(emp_id)
     except ValueError as exc:
         raise HTTPException(404, str(exc))
+    _invalidate_list_cache()
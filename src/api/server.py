@@ -1,15 +1,48 @@
+import logging
 import os
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from src.api.routes.employees import router as employees_router
+from src.db_connection import engine
+from src.employees_manager import EmployeesManager
 from dotenv import load_dotenv
 load_dotenv()
 
-app = FastAPI(title="Employees API", version="1.0.0")
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Created per worker process on startup rather than at import time
+    app.state.employees_manager = EmployeesManager()
+    try:
+        await app.state.employees_manager.warm_up()
+    except Exception:
+        # Warm-up is only an optimisation; a DB hiccup must not stop the worker booting
+        logger.warning("Statement cache warm-up failed; continuing startup", exc_info=True)
+    yield
+    await engine.dispose()
+
+
+app = FastAPI(
+    title="Employees API",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 # Register routers
 app.include_router(employees_router)
 
 
+@app.get("/", response_class=HTMLResponse, include_in_schema=False)
+async def read_root():
+    return "<h1>Employees API</h1><p>See <a href=\"/docs\">/docs</a> for the API reference.</p>"
+
+
 if __name__ == "__main__":
-    uvicorn.run("src.api.server:app", host=os.getenv("HOST"), port=int(os.getenv("PORT")), reload=True)
\ No newline at end of file
+    # Local development only; production runs under gunicorn (see startup.sh)
+    uvicorn.run("src.api.server:app", host=os.getenv("HOST"), port=int(os.getenv("PORT")), reload=True)
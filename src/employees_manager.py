@@ -1,24 +1,29 @@
 """
 employees_manager.py
 ~~~~~~~~~~~~~~~~~~~~
-CRUD‑style helper around an `employees` table, using SQLAlchemy Core/ORM.
+CRUD‑style helper around an `employees` table, using SQLAlchemy Core/ORM
+on top of an asyncio engine.
 
 Prerequisites
 -------------
-pip install sqlalchemy psycopg2‑binary
+pip install "sqlalchemy[asyncio]" asyncpg
 
-Make sure db_connection.py (with `engine`, `SessionLocal`) is importable.
+Make sure db_connection.py (with `SessionLocal`) is importable. The table is
+created by the Alembic migrations (`alembic upgrade head`), not at runtime.
 """
 
-from contextlib import contextmanager
-from typing import Any, Dict, List, Sequence
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Sequence, Tuple
 
-from sqlalchemy import Column, Integer, Numeric, String
+from sqlalchemy import (
+    Column, Index, Integer, Numeric, RowMapping, Select, String, bindparam, delete, insert,
+    select, update,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.exc import NoResultFound
-from sqlalchemy.orm import Session
 
-from src.db_connection import engine, SessionLocal
+from src.db_connection import SessionLocal
 
 Base = declarative_base()
 
@@ -31,7 +36,9 @@ class Employee(Base):
     name = Column(String, nullable=False)
     title = Column(String, nullable=False)
     job_history = Column(String)
-    salary = Column(Numeric(precision=12, scale=2), nullable=False)
+    # asyncpg decodes NUMERIC to float (codec in db_connection.py); asdecimal=False
+    # keeps the column typed as float on the SQLAlchemy side to match
+    salary = Column(Numeric(precision=12, scale=2, asdecimal=False), nullable=False)
     years_of_experience = Column(Integer, nullable=False)
 
     # Optional: nice Pythonic representation
@@ -42,22 +49,94 @@ class Employee(Base):
         )
 
 
-# Ensure the table exists (safe to run repeatedly)
-Base.metadata.create_all(bind=engine)
+# Indexes backing the common `get_top_employees` shapes: top-N by salary within
+# a title, and the "-years_of_experience, name" ordering.
+Index("ix_employees_title_salary", Employee.title, Employee.salary.desc())
+Index("ix_employees_yoe_name", Employee.years_of_experience.desc(), Employee.name)
 
 
-@contextmanager
-def _session_scope():
+# Statements reused across calls; ids are supplied as bound parameters so
+# every execution hits the same compiled-statement cache entry.
+_DELETE_BY_ID = delete(Employee).where(Employee.id == bindparam("emp_id"))
+
+# Columns `get_top_employees` can return, in output order
+_COLS = (
+    Employee.id,
+    Employee.name,
+    Employee.title,
+    Employee.job_history,
+    Employee.salary,
+    Employee.years_of_experience,
+)
+_FIELD_NAMES = tuple(c.key for c in _COLS)
+
+# Column lookup for user-supplied filter / ORDER BY names, resolved once at import
+_COL_MAP = {c.name: c for c in Employee.__table__.columns}
+
+
+def _column(name: str) -> Column:
+    try:
+        return _COL_MAP[name]
+    except KeyError:
+        raise ValueError(f"Unknown column: {name}") from None
+
+
+@lru_cache(maxsize=256)
+def _build_top_stmt(
+    order_key: Tuple[str, ...],
+    filter_keys: Tuple[str, ...],
+    field_keys: Tuple[str, ...] = _FIELD_NAMES,
+) -> Select:
+    """
+    Build the `get_top_employees` statement for one ORDER BY / filter / column shape.
+
+    Only the requested columns are selected, so rows come back as plain Core
+    rows rather than ORM entities. Filter values and the row limit are left as
+    bound parameters (named after the filter column and "n"), so a statement is
+    built once per shape and reused for every request with that shape.
+    """
+    unknown = set(field_keys).difference(_FIELD_NAMES)
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(sorted(unknown))}")
+    stmt = select(*[c for c in _COLS if c.key in field_keys])
+
+    # exact‑match filtering
+    for attr in filter_keys:
+        stmt = stmt.where(_column(attr) == bindparam(attr))
+
+    # build ORDER BY clause
+    ordering_clauses = []
+    for key in order_key:
+        desc = key.startswith("-")
+        col_name = key[1:] if desc else key
+        col = _column(col_name)
+        ordering_clauses.append(col.desc() if desc else col.asc())
+
+    return stmt.order_by(*ordering_clauses).limit(bindparam("n"))
+
+
+# (order_by, filter keys) shapes compiled ahead of the first request: the API
+# defaults plus the orderings backed by the indexes above
+_WARM_UP_SHAPES = (
+    (("-salary",), ()),
+    (("-salary",), ("title",)),
+    (("-years_of_experience", "name"), ()),
+    (("-years_of_experience", "name"), ("title",)),
+)
+
+
+@asynccontextmanager
+async def _session_scope() -> AsyncIterator[AsyncSession]:
     """Provide a transactional scope around a series of operations."""
-    session: Session = SessionLocal()
+    session: AsyncSession = SessionLocal()
     try:
         yield session
-        session.commit()
+        await session.commit()
     except Exception:
-        session.rollback()
+        await session.rollback()
         raise
     finally:
-        session.close()
+        await session.close()
 
 
 class EmployeesManager:
@@ -65,19 +144,32 @@ class EmployeesManager:
     High‑level helper class wrapping common operations on the employees table.
     Usage:
         mgr = EmployeesManager()
-        mgr.create_employee(...)
-        top = mgr.get_top_employees(3, order_by=["-salary", "name"])
+        await mgr.create_employee(...)
+        top = await mgr.get_top_employees(3, order_by=["-salary", "name"])
     """
 
+    # ---------- Setup ----------
+    async def warm_up(self) -> None:
+        """
+        Execute the canonical read statements once so SQLAlchemy's compiled
+        cache is populated before the first request. Only SELECTs are issued,
+        so this also works against a read-only role or replica.
+        """
+        async with SessionLocal() as session:
+            for order_key, filter_keys in _WARM_UP_SHAPES:
+                stmt = _build_top_stmt(order_key, filter_keys, _FIELD_NAMES)
+                await session.execute(stmt, {**dict.fromkeys(filter_keys), "n": 1})
+
     # ---------- Read ----------
-    def get_top_employees(
+    async def get_top_employees(
         self,
         n: int = 5,
         order_by: Sequence[str] | None = None,
         filters: Dict[str, Any] | None = None,
-    ) -> List[Employee]:
+        fields: Sequence[str] | None = None,
+    ) -> Sequence[RowMapping]:
         """
-        Return **n** employees ordered by the specified columns.
+        Return **n** employees ordered by the specified columns, as row mappings.
 
         Parameters
         ----------
@@ -88,35 +180,67 @@ class EmployeesManager:
             Defaults to ["-salary"].
         filters : dict[str, Any] | None
             Exact‑match filters, e.g. {"title": "Data Analyst"}.
+        fields : list[str] | None
+            Columns to include in each row, e.g. ["id", "name"].
+            Defaults to all returnable columns.
 
         Example
         -------
-        mgr.get_top_employees(10,
-                              order_by=["-years_of_experience", "name"],
-                              filters={"title": "Software Engineer"})
+        await mgr.get_top_employees(10,
+                                    order_by=["-years_of_experience", "name"],
+                                    filters={"title": "Software Engineer"})
         """
-        order_by = order_by or ["-salary"]
-        filters = filters or {}
+        stmt, params = self._top_query(n, order_by, filters, fields)
 
-        with _session_scope() as session:
-            query = session.query(Employee)
+        async with _session_scope() as session:
+            result = await session.execute(stmt, params)
+            return result.mappings().all()
 
-            # exact‑match filtering
-            for attr, value in filters.items():
-                query = query.filter(getattr(Employee, attr) == value)
+    def stream_top_employees(
+        self,
+        n: int = 5,
+        order_by: Sequence[str] | None = None,
+        filters: Dict[str, Any] | None = None,
+        fields: Sequence[str] | None = None,
+        chunk_size: int = 500,
+    ) -> AsyncIterator[Sequence[RowMapping]]:
+        """
+        Like `get_top_employees`, but yield the rows in chunks of **chunk_size**
+        read from a server-side cursor, so memory stays bounded regardless of **n**.
 
-            # build ORDER BY clause
-            ordering_clauses = []
-            for key in order_by:
-                desc = key.startswith("-")
-                col_name = key[1:] if desc else key
-                col = getattr(Employee, col_name)
-                ordering_clauses.append(col.desc() if desc else col.asc())
+        Arguments are validated immediately (raising ValueError); the session
+        stays open until the returned iterator is exhausted or closed.
+        """
+        stmt, params = self._top_query(n, order_by, filters, fields)
+        return self._stream_chunks(stmt, params, chunk_size)
 
-            return query.order_by(*ordering_clauses).limit(n).all()
+    @staticmethod
+    def _top_query(
+        n: int,
+        order_by: Sequence[str] | None,
+        filters: Dict[str, Any] | None,
+        fields: Sequence[str] | None,
+    ) -> Tuple[Select, Dict[str, Any]]:
+        order_by = order_by or ["-salary"]
+        filters = filters or {}
+
+        fields = tuple(sorted(set(fields))) if fields else _FIELD_NAMES
+        stmt = _build_top_stmt(tuple(order_by), tuple(sorted(filters)), fields)
+        return stmt, {**filters, "n": n}
+
+    @staticmethod
+    async def _stream_chunks(
+        stmt: Select, params: Dict[str, Any], chunk_size: int
+    ) -> AsyncIterator[Sequence[RowMapping]]:
+        async with _session_scope() as session:
+            result = await session.stream(
+                stmt, params, execution_options={"yield_per": chunk_size}
+            )
+            async for chunk in result.mappings().partitions():
+                yield chunk
 
     # ---------- Create ----------
-    def create_employee(
+    async def create_employee(
         self,
         name: str,
         title: str,
@@ -124,7 +248,7 @@ class EmployeesManager:
         salary: float,
         years_of_experience: int,
     ) -> Employee:
-        with _session_scope() as session:
+        async with _session_scope() as session:
             emp = Employee(
                 name=name,
                 title=title,
@@ -133,31 +257,51 @@ class EmployeesManager:
                 years_of_experience=years_of_experience,
             )
             session.add(emp)
-            session.flush()  # populate emp.id
+            await session.flush()  # populate emp.id
             return emp
 
+    async def bulk_create_employees(
+        self, rows: Sequence[Dict[str, Any]]
+    ) -> Sequence[RowMapping]:
+        """
+        Insert many employees in one executemany and return the created rows.
+
+        Each item in **rows** takes the same keys as `create_employee`. The
+        INSERTs are batched into multi-row ``INSERT ... VALUES ... RETURNING``
+        statements, with results in the same order as **rows**.
+        """
+        if not rows:
+            return []
+
+        stmt = insert(Employee).returning(*_COLS, sort_by_parameter_order=True)
+        async with _session_scope() as session:
+            result = await session.execute(stmt, list(rows))
+            return result.mappings().all()
+
     # ---------- Update ----------
-    def update_employee(self, emp_id: int, **updates) -> Employee:
-        with _session_scope() as session:
-            try:
-                emp: Employee = (
-                    session.query(Employee)
-                    .filter(Employee.id == emp_id)
-                    .one()
-                )
-            except NoResultFound:
-                raise ValueError(f"Employee with id {emp_id} does not exist")
+    async def update_employee(self, emp_id: int, **updates) -> Employee:
+        values = {k: v for k, v in updates.items() if k in Employee.__table__.c}
 
-            for attr, value in updates.items():
-                if hasattr(emp, attr):
-                    setattr(emp, attr, value)
-            session.add(emp)
+        # single round trip: UPDATE ... WHERE id = :id RETURNING *
+        stmt = (
+            update(Employee)
+            .where(Employee.id == emp_id)
+            .values(**values)
+            .returning(Employee)
+        )
+        async with _session_scope() as session:
+            result = await session.execute(
+                stmt, execution_options={"synchronize_session": False}
+            )
+            emp: Employee | None = result.scalar_one_or_none()
+            if emp is None:
+                raise ValueError(f"Employee with id {emp_id} does not exist")
             return emp
 
     # ---------- Delete ----------
-    def delete_employee(self, emp_id: int) -> None:
-        with _session_scope() as session:
-            deleted = session.query(Employee).filter(Employee.id == emp_id).delete()
-            if not deleted:
+    async def delete_employee(self, emp_id: int) -> None:
+        async with _session_scope() as session:
+            result = await session.execute(_DELETE_BY_ID, {"emp_id": emp_id})
+            if not result.rowcount:
                 raise ValueError(f"Employee with id {emp_id} does not exist")
 
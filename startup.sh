@@ -0,0 +1,25 @@
+#!/usr/bin/env bash
+# Production entry point: gunicorn supervising async uvicorn workers, one per
+# CPU by default. On single-CPU containers (e.g. Kubernetes pods) keep WORKERS=1
+# and scale out with more replicas instead.
+#
+# Connection budget: each worker holds up to DB_POOL_SIZE + DB_MAX_OVERFLOW
+# connections (10 + 5 by default), so WORKERS * 15 per instance, summed over
+# all instances, must stay below PostgreSQL's max_connections (100 by default,
+# less on small Azure Flexible Server tiers).
+set -e
+
+if [ -f .env ]; then
+    export $(grep -v '^#' .env | xargs)
+fi
+
+# Apply schema migrations once, before any worker starts
+alembic upgrade head
+
+exec gunicorn src.api.server:app \
+    -k uvicorn_worker.UvicornWorker \
+    -w "${WORKERS:-$(nproc)}" \
+    -b "0.0.0.0:${PORT}" \
+    --preload \
+    --log-level warning \
+    --timeout 60